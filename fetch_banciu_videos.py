@@ -10,15 +10,19 @@ where <date> is in Romanian format like "23 Septembrie"
 """
 
 import argparse
+import asyncio
 import csv
 import logging
 import re
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
 import yt_dlp
+from aiolimiter import AsyncLimiter
+from diskcache import Cache
 
 
 # Configure logging
@@ -45,6 +49,39 @@ ROMANIAN_MONTHS = {
     'decembrie': 12,
 }
 
+# Show names as they appear in normalized video titles
+SHOW_TITLES = ('prea mult banciu', 'preamultbanciu')
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Columns written to the output CSV
+VIDEO_FIELDS = ['url', 'title', 'date']
+
+# Persistent cache for YouTube lookups, so re-runs skip the network
+CACHE_DIR = '.cache/banciu'
+SEARCH_CACHE_TTL = 24 * 60 * 60  # 1 day
+cache = Cache(CACHE_DIR)
+
+# Search throttling: YouTube answers bursts of searches with 429s and bot
+# checks, so cap concurrency and rate, and back off when it pushes back.
+# MAX_CONCURRENT_SEARCHES is the default for --max-workers.
+MAX_CONCURRENT_SEARCHES = 4
+MAX_SEARCHES_PER_SECOND = 6
+MAX_SEARCH_RETRIES = 4
+RATE_LIMIT_MARKERS = ('429', 'not a bot')
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a title for matching: lowercase, punctuation replaced by spaces.
+
+    Args:
+        title: Video title like "PreaMultBanciu - 5 Decembrie | ..."
+
+    Returns:
+        Normalized title like "preamultbanciu 5 decembrie ..."
+    """
+    return _NON_WORD_RE.sub(' ', title.lower()).strip()
+
 
 def parse_romanian_date(date_str: str, year: int = 2024) -> Optional[str]:
     """
@@ -86,71 +123,150 @@ def parse_romanian_date(date_str: str, year: int = 2024) -> Optional[str]:
         return None
 
 
-def search_youtube_for_video(
-    search_query: str,
-    max_results: int = 5
-) -> List[Dict[str, str]]:
+def _banciu_title_filter(info: Dict, *, incomplete: bool = False) -> Optional[str]:
     """
-    Search YouTube for videos matching a query.
+    yt_dlp match_filter that skips search entries not mentioning Banciu.
 
-    Args:
-        search_query: Search query string
-        max_results: Maximum number of results to return
+    Accepts the incomplete keyword so yt_dlp also applies it to flat
+    playlist entries, before resolving them any further.
+    """
+    if 'banciu' in (info.get('title') or '').lower():
+        return None
+    return 'title does not mention Banciu'
 
-    Returns:
-        List of dicts with 'url', 'title', 'upload_date'
+
+@cache.memoize(expire=SEARCH_CACHE_TTL)
+def _fetch_search_results(search_query: str, max_results: int) -> List[Dict[str, str]]:
+    """
+    Run a YouTube search with yt_dlp. Results are cached on disk; errors
+    propagate so that failed searches are not cached.
+
+    Entries are taken from the flat search listing only, without resolving
+    each video, and titles that do not mention Banciu are dropped.
     """
     ydl_opts = {
         'quiet': True,
         'no_warnings': True,
-        'extract_flat': True,
-        'force_generic_extractor': False,
+        'extract_flat': 'in_playlist',
+        'playlistend': max_results,
+        'skip_download': True,
+        'simulate': True,
+        'match_filter': _banciu_title_filter,
     }
 
     results = []
 
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            search_results = ydl.extract_info(
-                f"ytsearch{max_results}:{search_query}",
-                download=False
-            )
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        search_results = ydl.extract_info(
+            f"ytsearch{max_results}:{search_query}",
+            download=False
+        )
+
+        if search_results and 'entries' in search_results:
+            for entry in search_results['entries']:
+                if entry:
+                    results.append({
+                        'url': f"https://www.youtube.com/watch?v={entry['id']}",
+                        'title': entry.get('title', 'Unknown'),
+                        'upload_date': entry.get('upload_date', '')
+                    })
 
-            if search_results and 'entries' in search_results:
-                for entry in search_results['entries']:
-                    if entry:
-                        results.append({
-                            'url': f"https://www.youtube.com/watch?v={entry['id']}",
-                            'title': entry.get('title', 'Unknown'),
-                            'upload_date': entry.get('upload_date', '')
-                        })
+    return results
 
-    except Exception as e:
-        logger.error(f"Search failed for '{search_query}': {e}")
 
-    return results
+async def search_youtube_for_video(
+    search_query: str,
+    max_results: int,
+    search_slots: asyncio.Semaphore,
+    search_limiter: AsyncLimiter,
+    executor: Optional[Executor] = None
+) -> List[Dict[str, str]]:
+    """
+    Search YouTube for videos matching a query.
 
+    Searches are throttled by search_slots (concurrency) and search_limiter
+    (start rate), which must belong to the running event loop. Rate-limited
+    searches are retried with exponential backoff. Successful searches are
+    cached on disk for SEARCH_CACHE_TTL seconds, and cached searches skip
+    the throttle.
 
-def find_video_for_date(
+    Args:
+        search_query: Search query string
+        max_results: Maximum number of results to return
+        search_slots: Semaphore capping concurrent searches
+        search_limiter: Limiter capping searches started per second
+        executor: Executor to run the blocking search in (default: loop's executor)
+
+    Returns:
+        List of dicts with 'url', 'title', 'upload_date'
+    """
+    cache_key = _fetch_search_results.__cache_key__(search_query, max_results)
+    cached_results = cache.get(cache_key)
+    if cached_results is not None:
+        return cached_results
+
+    loop = asyncio.get_running_loop()
+
+    for attempt in range(MAX_SEARCH_RETRIES + 1):
+        try:
+            async with search_slots, search_limiter:
+                return await loop.run_in_executor(
+                    executor,
+                    _fetch_search_results,
+                    search_query,
+                    max_results
+                )
+        except yt_dlp.utils.DownloadError as e:
+            rate_limited = any(marker in str(e) for marker in RATE_LIMIT_MARKERS)
+            if not rate_limited or attempt == MAX_SEARCH_RETRIES:
+                logger.error(f"Search failed for '{search_query}': {e}")
+                return []
+
+            delay = 2 ** attempt
+            logger.warning(f"Rate limited searching '{search_query}', retrying in {delay}s")
+            await asyncio.sleep(delay)
+        except yt_dlp.utils.YoutubeDLError as e:
+            logger.error(f"Search failed for '{search_query}': {e}")
+            return []
+
+    return []
+
+
+async def find_video_for_date(
     date_str: str,
     year: int = 2024,
-    channel: str = "Prea Mult Banciu"
+    channel: str = "Prea Mult Banciu",
+    executor: Optional[Executor] = None,
+    search_slots: Optional[asyncio.Semaphore] = None,
+    search_limiter: Optional[AsyncLimiter] = None
 ) -> Optional[Dict[str, str]]:
     """
     Find a Banciu video for a specific date.
 
-    Tries multiple search variations:
+    Runs a single search for "Banciu <date>" and picks the first result
+    whose title names the show and contains the date:
     1. "Prea Mult Banciu - <date>"
     2. "PreaMultBanciu - <date>"
 
+    Found videos are cached on disk for SEARCH_CACHE_TTL seconds.
+
     Args:
         date_str: Romanian date string like "5 Decembrie"
         year: Year (default: 2024)
         channel: Channel name for searching
+        executor: Executor to run the blocking search in (default: loop's executor)
+        search_slots: Semaphore shared by concurrent searches (default: a new one)
+        search_limiter: Rate limiter shared by concurrent searches (default: a new one)
 
     Returns:
         Dict with 'url', 'title', 'date' or None if not found
     """
+    cache_key = ('find_video_for_date', date_str, year)
+    cached_video = cache.get(cache_key)
+    if cached_video is not None:
+        logger.info(f"Found cached video for {date_str}: {cached_video['title']}")
+        return cached_video
+
     logger.info(f"Searching for video: {date_str}")
 
     # Parse date to standard format
@@ -159,54 +275,82 @@ def find_video_for_date(
         logger.error(f"Could not parse date: {date_str}")
         return None
 
-    # Try different search patterns
-    search_patterns = [
-        f"Prea Mult Banciu - {date_str}",
-        f"PreaMultBanciu - {date_str}",
-        f"Prea Mult Banciu {date_str}",
-        f"PreaMultBanciu {date_str}",
-    ]
-
-    for pattern in search_patterns:
-        logger.debug(f"Trying search pattern: {pattern}")
-        results = search_youtube_for_video(pattern, max_results=3)
-
-        for result in results:
-            title = result['title']
+    if search_slots is None:
+        search_slots = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+    if search_limiter is None:
+        search_limiter = AsyncLimiter(MAX_SEARCHES_PER_SECOND, 1.0)
+
+    results = await search_youtube_for_video(
+        f"Banciu {date_str}",
+        10,
+        search_slots,
+        search_limiter,
+        executor
+    )
 
-            # Check if title matches expected format
-            # Should contain the date string
-            if date_str.lower() in title.lower():
-                logger.info(f"Found video: {title}")
-                return {
-                    'url': result['url'],
-                    'title': title,
-                    'date': standard_date
-                }
+    # Match the date as whole words, so "5 Decembrie" does not match "25 Decembrie"
+    date_re = re.compile(rf'\b{re.escape(normalize_title(date_str))}\b')
+
+    for result in results:
+        title = result['title']
+        normalized_title = normalize_title(title)
+
+        # Check if title matches expected format
+        # Should contain the show name and the date string
+        if (any(show in normalized_title for show in SHOW_TITLES)
+                and date_re.search(normalized_title)):
+            logger.info(f"Found video: {title}")
+            video = {
+                'url': result['url'],
+                'title': title,
+                'date': standard_date
+            }
+            cache.set(cache_key, video, expire=SEARCH_CACHE_TTL)
+            return video
 
     logger.warning(f"No video found for: {date_str}")
     return None
 
 
-def fetch_videos_for_dates(
+async def fetch_videos_for_dates(
     dates: List[str],
-    year: int = 2024
+    year: int = 2024,
+    max_workers: int = MAX_CONCURRENT_SEARCHES
 ) -> List[Dict[str, str]]:
     """
-    Fetch videos for a list of dates.
+    Fetch videos for a list of dates, searching for all dates concurrently.
 
     Args:
         dates: List of Romanian date strings
         year: Year for the dates
+        max_workers: Maximum number of concurrent YouTube searches
 
     Returns:
-        List of video dicts with 'url', 'title', 'date'
+        List of video dicts with 'url', 'title', 'date', in the order of dates
     """
+    # Throttles are created here so they belong to the running event loop
+    search_slots = asyncio.Semaphore(max_workers)
+    search_limiter = AsyncLimiter(MAX_SEARCHES_PER_SECOND, 1.0)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        found = await asyncio.gather(*(
+            find_video_for_date(
+                date_str,
+                year,
+                executor=executor,
+                search_slots=search_slots,
+                search_limiter=search_limiter
+            )
+            for date_str in dates
+        ), return_exceptions=True)
+
     videos = []
 
-    for date_str in dates:
-        video = find_video_for_date(date_str, year)
-        if video:
+    # A failed search only skips its own date; the other results are kept
+    for date_str, video in zip(dates, found):
+        if isinstance(video, Exception):
+            logger.error(f"Error fetching video for {date_str}: {video}", exc_info=video)
+        elif video:
             videos.append(video)
         else:
             logger.warning(f"Skipping {date_str} - not found")
@@ -224,10 +368,12 @@ def save_videos_to_csv(videos: List[Dict[str, str]], output_file: str) -> None:
     """
     output_path = Path(output_file)
 
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['url', 'title', 'date'])
-        writer.writeheader()
-        writer.writerows(videos)
+    # csv quotes only fields that need it (pyarrow quotes every string), which
+    # keeps regenerated files identical to the committed ones
+    with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(VIDEO_FIELDS)
+        writer.writerows([video[field] for field in VIDEO_FIELDS] for video in videos)
 
     logger.info(f"Saved {len(videos)} videos to {output_file}")
 
@@ -258,6 +404,12 @@ def main():
         action='store_true',
         help='Use the predefined list of dates'
     )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=MAX_CONCURRENT_SEARCHES,
+        help=f'Maximum number of concurrent YouTube searches (default: {MAX_CONCURRENT_SEARCHES})'
+    )
 
     args = parser.parse_args()
 
@@ -289,7 +441,7 @@ def main():
     logger.info(f"Fetching videos for {len(dates)} dates")
 
     # Fetch videos
-    videos = fetch_videos_for_dates(dates, args.year)
+    videos = asyncio.run(fetch_videos_for_dates(dates, args.year, args.max_workers))
 
     if not videos:
         logger.error("No videos found!")
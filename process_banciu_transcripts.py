@@ -7,17 +7,28 @@ cleans the text, and chunks it for later use in a RAG pipeline.
 """
 
 import argparse
-import csv
-import json
 import logging
+import multiprocessing
+import os
 import re
+import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Dict, Optional
-from urllib.parse import parse_qs, urlparse
-
+from typing import Any, Iterator, List, Dict, Optional
+
+import ctranslate2
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import yt_dlp
-import whisper
+from diskcache import Cache
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from youtube_transcript_api import YouTubeTranscriptApi
 
 
 # Configure logging
@@ -27,6 +38,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns required in the input CSV
+VIDEO_FIELDS = ['url', 'title', 'date']
+
+# 11-character video ID in watch?v=, youtu.be/, /embed/ and /v/ URLs
+_VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|/embed/|/v/)([A-Za-z0-9_-]{11})')
+
+# Default cap on simultaneous yt_dlp downloads, to stay clear of YouTube rate
+# limits (override with --download-workers)
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Persistent cache of parsed subtitle text, keyed by video ID
+CACHE_DIR = '.cache/banciu'
+SUBTITLE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+cache = Cache(CACHE_DIR)
+
+# Number of 30-second audio windows sent through the Whisper encoder at once
+DEFAULT_WHISPER_BATCH_SIZE = 16
+
+# Whisper expects 16 kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+# One SRT cue: sequence number, timestamp line, then the text lines up to
+# the next blank line (captured)
+_SRT_CUE_RE = re.compile(
+    r'^\d+[ \t]*\r?\n[\d:,.]+[ \t]*-->[ \t]*[\d:,.]+[^\n]*\n((?:[^\n]*\S[^\n]*(?:\n|\Z))*)',
+    re.MULTILINE
+)
+
+# Transcript cleanup patterns, compiled once at import
+_PLACEHOLDER_RE = re.compile(r'\[(?:music|applause|laughter)\]', re.IGNORECASE)
+_SPACES_RE = re.compile(r' +')
+_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# Sentence boundary (simple heuristic): whitespace after a period, question
+# mark, or exclamation mark that is followed by an uppercase letter
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+(?=[A-ZĂÂÎȘȚ])')
+
+# Chunk overlap may grow to this multiple of --overlap-words to end on a
+# sentence boundary; past that, only the tail words of a sentence are reused
+MAX_OVERLAP_FACTOR = 2
+
 
 def load_video_list(input_file: str) -> List[Dict[str, str]]:
     """
@@ -36,24 +88,39 @@ def load_video_list(input_file: str) -> List[Dict[str, str]]:
         input_file: Path to CSV file with columns: url, title, date
 
     Returns:
-        List of dicts with keys: url, title, date
+        List of dicts with keys: url, title, date, video_id (None if the URL
+        is not a recognised YouTube video URL)
     """
     input_path = Path(input_file)
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    videos = []
-    with open(input_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if 'url' not in row or 'title' not in row or 'date' not in row:
-                logger.warning(f"Skipping row with missing fields: {row}")
-                continue
-            videos.append({
-                'url': row['url'].strip(),
-                'title': row['title'].strip(),
-                'date': row['date'].strip()
-            })
+    def skip_invalid_row(row: pacsv.InvalidRow) -> str:
+        logger.warning(f"Skipping row with missing fields: {row.text}")
+        return 'skip'
+
+    # Read the required columns as strings (so dates stay 'YYYY-MM-DD')
+    table = pacsv.read_csv(
+        input_path,
+        parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid_row),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in VIDEO_FIELDS}
+        )
+    )
+
+    missing_fields = [name for name in VIDEO_FIELDS if name not in table.column_names]
+    if missing_fields:
+        raise ValueError(f"Input file is missing columns: {', '.join(missing_fields)}")
+
+    table = pa.table({
+        name: pc.utf8_trim_whitespace(table[name])
+        for name in VIDEO_FIELDS
+    })
+    videos = table.to_pylist()
+
+    # Resolve video IDs once, for every later stage to reuse
+    for video_info in videos:
+        video_info['video_id'] = extract_video_id(video_info['url'])
 
     logger.info(f"Loaded {len(videos)} videos from {input_file}")
     return videos
@@ -69,42 +136,117 @@ def extract_video_id(url: str) -> Optional[str]:
     Returns:
         Video ID string or None if not found
     """
-    parsed = urlparse(url)
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def stream_audio_pcm(url: str) -> np.ndarray:
+    """
+    Download a video's audio and decode it to 16 kHz mono PCM in memory.
+
+    yt-dlp writes the audio stream to stdout and ffmpeg decodes it straight
+    from the pipe, so no audio file is written to disk.
+
+    Args:
+        url: YouTube video URL
 
-    # Handle youtu.be short URLs
-    if parsed.hostname == 'youtu.be':
-        return parsed.path[1:]
+    Returns:
+        16-bit PCM samples at WHISPER_SAMPLE_RATE
+    """
+    # yt-dlp's stderr goes to a temp file: it is only read once ffmpeg is
+    # done, and a full pipe would block yt-dlp and stall the whole chain
+    with tempfile.TemporaryFile() as ytdlp_stderr:
+        ytdlp = subprocess.Popen(
+            [
+                sys.executable, '-m', 'yt_dlp',
+                '--quiet', '--no-warnings', '--no-progress',
+                '--format', 'bestaudio/best',
+                '--output', '-',
+                url,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=ytdlp_stderr
+        )
 
-    # Handle youtube.com URLs
-    if parsed.hostname in ('www.youtube.com', 'youtube.com'):
-        if parsed.path == '/watch':
-            query = parse_qs(parsed.query)
-            return query.get('v', [None])[0]
-        elif parsed.path.startswith('/embed/'):
-            return parsed.path.split('/')[2]
-        elif parsed.path.startswith('/v/'):
-            return parsed.path.split('/')[2]
+        try:
+            ffmpeg = subprocess.Popen(
+                [
+                    'ffmpeg', '-loglevel', 'error',
+                    '-i', 'pipe:0',
+                    '-ar', str(WHISPER_SAMPLE_RATE), '-ac', '1',
+                    '-f', 's16le', '-',
+                ],
+                stdin=ytdlp.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except OSError:
+            ytdlp.kill()
+            ytdlp.wait()
+            raise
+        finally:
+            # Close our copy so yt-dlp gets SIGPIPE if ffmpeg exits early
+            ytdlp.stdout.close()
+
+        pcm, ffmpeg_stderr = ffmpeg.communicate()
+        ytdlp.wait()
+
+        if ytdlp.returncode != 0:
+            ytdlp_stderr.seek(0)
+            message = ytdlp_stderr.read().decode(errors='replace').strip()
+            raise RuntimeError(f"yt-dlp exited with code {ytdlp.returncode}: {message}")
+
+    if ffmpeg.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg exited with code {ffmpeg.returncode}: "
+            f"{ffmpeg_stderr.decode(errors='replace').strip()}"
+        )
 
-    return None
+    return np.frombuffer(pcm, dtype=np.int16)
+
+
+def fetch_transcript_text(video_id: str) -> str:
+    """
+    Fetch a video's Romanian transcript with youtube-transcript-api.
+
+    A single request to YouTube's timedtext endpoint, with no SRT file to
+    write or parse. Manually created transcripts are preferred over
+    auto-generated ones.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Transcript text
+    """
+    transcript = YouTubeTranscriptApi().fetch(video_id, languages=['ro'])
+    text = ' '.join(snippet.text for snippet in transcript)
+
+    return ' '.join(text.split())
 
 
 def download_subtitles_or_audio(
     video_info: Dict[str, str],
     temp_dir: Path,
     use_youtube_subtitles: bool = True
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """
     Download Romanian subtitles or audio from YouTube video.
 
+    Subtitles are fetched with youtube-transcript-api, falling back to an
+    SRT file downloaded by yt_dlp into temp_dir. Audio is decoded in memory
+    and never touches the disk.
+
     Args:
-        video_info: Dict with 'url', 'title', 'date'
-        temp_dir: Directory to store downloaded files
+        video_info: Dict with 'url', 'title', 'date', 'video_id'
+        temp_dir: Directory to store downloaded subtitle files
         use_youtube_subtitles: Whether to try YouTube subtitles first
 
     Returns:
-        Dict with 'type' ('subtitles' or 'audio') and 'path' (file path)
+        Dict with 'type' ('subtitles' or 'audio') and either 'text'
+        (subtitle text) or 'audio' (16 kHz 16-bit PCM samples)
     """
-    video_id = extract_video_id(video_info['url'])
+    video_id = video_info['video_id']
     if not video_id:
         raise ValueError(f"Could not extract video ID from URL: {video_info['url']}")
 
@@ -112,6 +254,13 @@ def download_subtitles_or_audio(
 
     # Try to download Romanian subtitles first
     if use_youtube_subtitles:
+        try:
+            text = fetch_transcript_text(video_id)
+            logger.info(f"Fetched Romanian transcript for {video_id}")
+            return {'type': 'subtitles', 'text': text}
+        except Exception as e:
+            logger.warning(f"Failed to fetch transcript for {video_id}: {e}")
+
         subtitle_path = temp_dir / f"{video_id}.ro.srt"
 
         ydl_opts_subs = {
@@ -132,30 +281,16 @@ def download_subtitles_or_audio(
             # Check if subtitle file was created
             if subtitle_path.exists():
                 logger.info(f"Downloaded Romanian subtitles for {video_id}")
-                return {'type': 'subtitles', 'path': str(subtitle_path)}
+                return {'type': 'subtitles', 'text': parse_subtitles(subtitle_path)}
         except Exception as e:
             logger.warning(f"Failed to download subtitles for {video_id}: {e}")
 
-    # Fallback: download audio
-    audio_path = temp_dir / f"{video_id}.m4a"
-
-    ydl_opts_audio = {
-        'format': 'bestaudio/best',
-        'outtmpl': str(temp_dir / f"{video_id}.%(ext)s"),
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'm4a',
-        }],
-        'quiet': True,
-        'no_warnings': True,
-    }
-
+    # Fallback: stream audio
     try:
-        with yt_dlp.YoutubeDL(ydl_opts_audio) as ydl:
-            ydl.download([video_info['url']])
-
-        logger.info(f"Downloaded audio for {video_id}")
-        return {'type': 'audio', 'path': str(audio_path)}
+        audio = stream_audio_pcm(video_info['url'])
+        duration = len(audio) / WHISPER_SAMPLE_RATE
+        logger.info(f"Downloaded audio for {video_id} ({duration:.0f}s)")
+        return {'type': 'audio', 'audio': audio}
     except Exception as e:
         raise RuntimeError(f"Failed to download audio for {video_id}: {e}")
 
@@ -170,46 +305,73 @@ def parse_subtitles(subtitle_path: Path) -> str:
     Returns:
         Concatenated subtitle text
     """
-    with open(subtitle_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = subtitle_path.read_text(encoding='utf-8-sig')
 
     # SRT format: number, timestamp, text, blank line
-    # Remove sequence numbers and timestamps, keep only text
-    lines = content.split('\n')
-    text_lines = []
-
-    for line in lines:
-        line = line.strip()
-        # Skip empty lines, numbers, and timestamp lines
-        if not line or line.isdigit() or '-->' in line:
-            continue
-        text_lines.append(line)
+    # Keep only the text of each cue and collapse whitespace between lines
+    cue_text = ' '.join(_SRT_CUE_RE.findall(content))
 
-    return ' '.join(text_lines)
+    return ' '.join(cue_text.split())
 
 
-def transcribe_audio_with_whisper(audio_path: Path, model_name: str = "medium") -> str:
+def load_whisper_model(model_name: str) -> BatchedInferencePipeline:
     """
-    Transcribe audio file to Romanian text using Whisper.
+    Load a Whisper model for batched inference on the best available device.
+
+    Uses int8 weights with float16 compute on CUDA, and int8 on CPU. Load it
+    once per run and pass it to every transcription, so the weights, CUDA
+    context and kernel caches stay warm across the batch.
 
     Args:
-        audio_path: Path to audio file
         model_name: Whisper model to use (tiny, base, small, medium, large)
 
     Returns:
-        Transcribed text
+        Batched inference pipeline wrapping the loaded model
+    """
+    if ctranslate2.get_cuda_device_count() > 0:
+        device, compute_type = 'cuda', 'int8_float16'
+    else:
+        device, compute_type = 'cpu', 'int8'
+
+    logger.info(f"Loading Whisper model: {model_name} ({device}, {compute_type})")
+    model = WhisperModel(model_name, device=device, compute_type=compute_type)
+
+    return BatchedInferencePipeline(model=model)
+
+
+def transcribe_audio_with_whisper(
+    audio: np.ndarray,
+    model: BatchedInferencePipeline,
+    batch_size: int = DEFAULT_WHISPER_BATCH_SIZE
+) -> str:
     """
-    logger.info(f"Loading Whisper model: {model_name}")
-    model = whisper.load_model(model_name)
+    Transcribe in-memory audio samples to Romanian text using Whisper.
+
+    Speech segments found by the VAD filter are transcribed in batches of
+    30-second windows, so long episodes keep the GPU busy. Decoding is
+    greedy and each window is decoded independently of the previous text,
+    which keeps decoder work to a minimum.
+
+    Args:
+        audio: 16 kHz mono 16-bit PCM samples
+        model: Model returned by load_whisper_model
+        batch_size: Number of audio windows transcribed per batch
 
-    logger.info(f"Transcribing audio: {audio_path}")
-    result = model.transcribe(
-        str(audio_path),
+    Returns:
+        Transcribed text
+    """
+    logger.info(f"Transcribing {len(audio) / WHISPER_SAMPLE_RATE:.0f}s of audio")
+    segments, _ = model.transcribe(
+        audio.astype(np.float32) / 32768.0,
         language='ro',
-        verbose=False
+        beam_size=1,
+        best_of=1,
+        condition_on_previous_text=False,
+        vad_filter=True,
+        batch_size=batch_size
     )
 
-    return result['text']
+    return ' '.join(segment.text.strip() for segment in segments)
 
 
 def clean_transcript_text(raw_text: str) -> str:
@@ -222,22 +384,14 @@ def clean_transcript_text(raw_text: str) -> str:
     Returns:
         Cleaned text
     """
-    text = raw_text
-
-    # Remove common placeholder tokens
-    placeholders = [
-        r'\[Music\]', r'\[Applause\]', r'\[Laughter\]',
-        r'\[music\]', r'\[applause\]', r'\[laughter\]',
-        r'\[MUSIC\]', r'\[APPLAUSE\]', r'\[LAUGHTER\]'
-    ]
-    for placeholder in placeholders:
-        text = re.sub(placeholder, '', text)
+    # Remove common placeholder tokens ([Music], [APPLAUSE], ...)
+    text = _PLACEHOLDER_RE.sub('', raw_text)
 
     # Replace multiple spaces with single space
-    text = re.sub(r' +', ' ', text)
+    text = _SPACES_RE.sub(' ', text)
 
     # Replace multiple newlines with double newline (paragraph separator)
-    text = re.sub(r'\n\n+', '\n\n', text)
+    text = _NEWLINES_RE.sub('\n\n', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -245,6 +399,19 @@ def clean_transcript_text(raw_text: str) -> str:
     return text
 
 
+def _iter_sentences(text: str) -> Iterator[str]:
+    """
+    Lazily split text into sentences at _SENTENCE_BOUNDARY_RE.
+
+    Yields the same pieces as re.split, without building the full list.
+    """
+    start = 0
+    for boundary in _SENTENCE_BOUNDARY_RE.finditer(text):
+        yield text[start:boundary.start()]
+        start = boundary.end()
+    yield text[start:]
+
+
 def split_into_chunks(
     clean_text: str,
     target_word_count: int = 1200,
@@ -256,44 +423,58 @@ def split_into_chunks(
     Args:
         clean_text: Cleaned transcript text
         target_word_count: Target words per chunk (soft upper bound)
-        overlap_words: Number of words to overlap between chunks
+        overlap_words: Minimum number of words to overlap between chunks;
+            the overlap is made of whole sentences from the previous chunk
+            unless that would exceed MAX_OVERLAP_FACTOR * overlap_words, in
+            which case the last sentence taken is cut to its tail words
 
     Returns:
         List of text chunks
     """
-    # Split into sentences (simple heuristic)
-    # Match period, question mark, or exclamation followed by space and uppercase
-    sentence_pattern = r'(?<=[.!?])\s+(?=[A-ZĂÂÎȘȚ])'
-    sentences = re.split(sentence_pattern, clean_text)
-
     chunks = []
     current_chunk = []
+    word_counts = []  # word count of each sentence in current_chunk
     current_word_count = 0
 
-    for sentence in sentences:
+    for sentence in _iter_sentences(clean_text):
         sentence = sentence.strip()
         if not sentence:
             continue
 
-        sentence_words = sentence.split()
-        sentence_word_count = len(sentence_words)
+        sentence_word_count = len(sentence.split())
 
         # If adding this sentence exceeds target, save current chunk and start new one
         if current_word_count + sentence_word_count > target_word_count and current_chunk:
             # Save current chunk
             chunks.append(' '.join(current_chunk))
 
-            # Start new chunk with overlap from previous chunk
-            if overlap_words > 0:
-                all_words = ' '.join(current_chunk).split()
-                overlap_start = max(0, len(all_words) - overlap_words)
-                current_chunk = [' '.join(all_words[overlap_start:])]
-                current_word_count = len(current_chunk[0].split())
-            else:
-                current_chunk = []
-                current_word_count = 0
+            # Start new chunk with the trailing sentences of the previous chunk,
+            # taking whole sentences until at least overlap_words are covered.
+            # A sentence that would push the overlap past the cap (or take the
+            # whole previous chunk) contributes only its last words.
+            max_overlap = MAX_OVERLAP_FACTOR * overlap_words
+            overlap_start = len(current_chunk)
+            overlap_tail = []
+            current_word_count = 0
+            while overlap_start > 0 and current_word_count < overlap_words:
+                previous_word_count = word_counts[overlap_start - 1]
+                if overlap_start == 1 or current_word_count + previous_word_count > max_overlap:
+                    overlap_tail = current_chunk[overlap_start - 1].split()[
+                        current_word_count - overlap_words:
+                    ]
+                    break
+                overlap_start -= 1
+                current_word_count += previous_word_count
+
+            current_chunk = current_chunk[overlap_start:]
+            word_counts = word_counts[overlap_start:]
+            if overlap_tail:
+                current_chunk.insert(0, ' '.join(overlap_tail))
+                word_counts.insert(0, len(overlap_tail))
+                current_word_count += len(overlap_tail)
 
         current_chunk.append(sentence)
+        word_counts.append(sentence_word_count)
         current_word_count += sentence_word_count
 
     # Add remaining chunk
@@ -312,14 +493,14 @@ def build_episode_json(
     Build JSON structure for episode data.
 
     Args:
-        video_info: Dict with 'url', 'title', 'date'
+        video_info: Dict with 'url', 'title', 'date', 'video_id'
         cleaned_text: Full cleaned transcript
         chunks: List of text chunks
 
     Returns:
         Episode data dict ready for JSON serialization
     """
-    video_id = extract_video_id(video_info['url'])
+    video_id = video_info['video_id']
 
     # Create episode ID from video ID or fallback to title + date slug
     if video_id:
@@ -362,57 +543,118 @@ def save_episode_json(episode_data: Dict, output_dir: Path) -> None:
 
     output_file = output_dir / f"{episode_data['episode_id']}.json"
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(episode_data, f, ensure_ascii=False, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(episode_data, option=orjson.OPT_INDENT_2))
 
     logger.info(f"Saved episode JSON: {output_file}")
 
 
-def process_video(
+def download_stage(
     video_info: Dict[str, str],
     temp_dir: Path,
-    output_dir: Path,
     use_youtube_subtitles: bool,
-    whisper_model: str,
-    target_word_count: int,
-    overlap_words: int
-) -> bool:
+    download_slots: threading.Semaphore
+) -> Dict[str, Any]:
     """
-    Process a single video end-to-end.
+    Download stage (I/O bound): fetch subtitles or audio for a single video.
+
+    Safe to run from multiple threads; download_slots bounds how many
+    downloads are in flight at any time. Subtitle text is cached on disk for
+    SUBTITLE_CACHE_TTL seconds, so warm runs skip the download entirely.
 
     Args:
-        video_info: Dict with 'url', 'title', 'date'
+        video_info: Dict with 'url', 'title', 'date', 'video_id'
         temp_dir: Temporary directory for downloads
-        output_dir: Output directory for JSON files
         use_youtube_subtitles: Whether to try YouTube subtitles
-        whisper_model: Whisper model name
-        target_word_count: Target words per chunk
-        overlap_words: Overlap between chunks
+        download_slots: Semaphore shared by all download threads
 
     Returns:
-        True if successful, False otherwise
+        Dict with 'type' ('subtitles' or 'audio') and either 'text'
+        (subtitle text) or 'audio' (16 kHz 16-bit PCM samples)
     """
-    try:
-        logger.info(f"Processing: {video_info['title']} ({video_info['date']})")
+    video_id = video_info['video_id']
+    cache_key = ('subtitles', video_id)
 
-        # Download subtitles or audio
+    if use_youtube_subtitles and video_id:
+        cached_text = cache.get(cache_key)
+        if cached_text is not None:
+            logger.info(f"Using cached subtitles for {video_id}")
+            return {'type': 'subtitles', 'text': cached_text}
+
+    logger.info(f"Downloading: {video_info['title']} ({video_info['date']})")
+
+    with download_slots:
         download_result = download_subtitles_or_audio(
             video_info,
             temp_dir,
             use_youtube_subtitles
         )
 
-        # Get transcript
-        if download_result['type'] == 'subtitles':
-            logger.info("Extracting text from subtitles")
-            raw_text = parse_subtitles(Path(download_result['path']))
-        else:
-            logger.info("Transcribing audio with Whisper")
-            raw_text = transcribe_audio_with_whisper(
-                Path(download_result['path']),
-                whisper_model
-            )
+    if download_result['type'] == 'subtitles':
+        cache.set(cache_key, download_result['text'], expire=SUBTITLE_CACHE_TTL)
+
+    return download_result
+
+
+def transcribe_stage(
+    video_info: Dict[str, str],
+    download_result: Dict[str, Any],
+    whisper_model: Optional[BatchedInferencePipeline],
+    whisper_batch_size: int
+) -> str:
+    """
+    Transcribe stage (GPU bound): get the raw transcript of a downloaded video.
 
+    Subtitle text is used as is; audio is transcribed with Whisper. Runs in
+    the main process so only one Whisper model is in use at a time.
+
+    Args:
+        video_info: Dict with 'url', 'title', 'date', 'video_id'
+        download_result: Result of download_stage for this video
+        whisper_model: Model returned by load_whisper_model (required for audio)
+        whisper_batch_size: Number of audio windows transcribed per batch
+
+    Returns:
+        Raw transcript text
+    """
+    logger.info(f"Processing: {video_info['title']} ({video_info['date']})")
+
+    if download_result['type'] == 'subtitles':
+        logger.info("Using text from subtitles")
+        return download_result['text']
+
+    logger.info("Transcribing audio with Whisper")
+    return transcribe_audio_with_whisper(
+        download_result['audio'],
+        whisper_model,
+        whisper_batch_size
+    )
+
+
+def _process_text_pipeline(
+    video_info: Dict[str, str],
+    raw_text: str,
+    output_dir: Path,
+    target_word_count: int,
+    overlap_words: int
+) -> bool:
+    """
+    Text stage (CPU bound): clean, chunk and save a transcript as episode JSON.
+
+    Runs in a worker process, so the regex-heavy work of several episodes
+    proceeds in parallel outside the GIL.
+
+    Args:
+        video_info: Dict with 'url', 'title', 'date', 'video_id'
+        raw_text: Raw transcript text
+        output_dir: Output directory for JSON files
+        target_word_count: Target words per chunk
+        overlap_words: Overlap between chunks
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
         # Clean transcript
         cleaned_text = clean_transcript_text(raw_text)
         logger.info(f"Cleaned transcript length: {len(cleaned_text)} characters")
@@ -472,6 +714,12 @@ def main():
         choices=['tiny', 'base', 'small', 'medium', 'large'],
         help='Whisper model to use for transcription (default: medium)'
     )
+    parser.add_argument(
+        '--whisper-batch-size',
+        type=int,
+        default=DEFAULT_WHISPER_BATCH_SIZE,
+        help=f'Audio windows per Whisper batch (default: {DEFAULT_WHISPER_BATCH_SIZE})'
+    )
     parser.add_argument(
         '--target-word-count',
         type=int,
@@ -484,6 +732,12 @@ def main():
         default=100,
         help='Words to overlap between chunks (default: 100)'
     )
+    parser.add_argument(
+        '--download-workers',
+        type=int,
+        default=MAX_CONCURRENT_DOWNLOADS,
+        help=f'Number of videos to download in parallel (default: {MAX_CONCURRENT_DOWNLOADS})'
+    )
 
     args = parser.parse_args()
 
@@ -507,25 +761,103 @@ def main():
         videos = videos[:args.max_videos]
         logger.info(f"Processing first {len(videos)} videos")
 
-    # Process each video
+    # Whisper model, loaded when the first video without subtitles needs it
+    # and then kept for the rest of the batch
+    whisper_model = None
+
+    # Process videos as a pipeline: downloads run in a thread pool, finished
+    # downloads are transcribed one at a time on this thread, and transcripts
+    # are cleaned, chunked and saved in a process pool. The pool workers are
+    # not forked from this process, because by now it already runs threads
+    # (pyarrow's CSV reader pool) that fork() would not copy safely. They are
+    # started through a forkserver where available and spawned elsewhere
+    # (Windows).
     success_count = 0
     failure_count = 0
 
-    for video_info in videos:
-        success = process_video(
-            video_info,
-            temp_dir,
-            output_dir,
-            args.use_youtube_subtitles,
-            args.whisper_model,
-            args.target_word_count,
-            args.overlap_words
-        )
+    text_workers = min(os.cpu_count() or 1, len(videos))
+    download_slots = threading.Semaphore(args.download_workers)
+    start_method = (
+        'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+        else 'spawn'
+    )
 
-        if success:
-            success_count += 1
-        else:
-            failure_count += 1
+    with multiprocessing.get_context(start_method).Pool(processes=text_workers) as text_pool, \
+            ThreadPoolExecutor(max_workers=args.download_workers) as executor:
+        pending_videos = iter(videos)
+        downloads = {}
+        text_results = []
+
+        def submit_next_download() -> None:
+            video_info = next(pending_videos, None)
+            if video_info is not None:
+                future = executor.submit(
+                    download_stage,
+                    video_info,
+                    temp_dir,
+                    args.use_youtube_subtitles,
+                    download_slots
+                )
+                downloads[future] = video_info
+
+        # Downloads are submitted lazily: at most download_workers + 1 are
+        # outstanding, so decoded audio cannot pile up in memory while this
+        # thread is busy transcribing
+        for _ in range(args.download_workers + 1):
+            submit_next_download()
+
+        while downloads:
+            done, _ = wait(downloads, return_when=FIRST_COMPLETED)
+
+            while done:
+                future = done.pop()
+                video_info = downloads.pop(future)
+                download_error = future.exception()
+                download_result = None if download_error else future.result()
+                # From here on only download_result refers to the decoded audio
+                del future
+
+                if download_error is not None:
+                    logger.error(
+                        f"Failed to download {video_info['title']}: {download_error}",
+                        exc_info=download_error
+                    )
+                    failure_count += 1
+                else:
+                    try:
+                        if download_result['type'] == 'audio' and whisper_model is None:
+                            whisper_model = load_whisper_model(args.whisper_model)
+
+                        raw_text = transcribe_stage(
+                            video_info,
+                            download_result,
+                            whisper_model,
+                            args.whisper_batch_size
+                        )
+
+                        text_results.append(text_pool.apply_async(
+                            _process_text_pipeline,
+                            (
+                                video_info,
+                                raw_text,
+                                output_dir,
+                                args.target_word_count,
+                                args.overlap_words
+                            )
+                        ))
+                    except Exception as e:
+                        logger.error(f"Failed to process {video_info['title']}: {e}", exc_info=True)
+                        failure_count += 1
+
+                # Release the audio before the next download is started
+                download_result = None
+                submit_next_download()
+
+        for result in text_results:
+            if result.get():
+                success_count += 1
+            else:
+                failure_count += 1
 
     # Summary
     logger.info("=" * 60)